@@ -127,7 +127,7 @@ class CPT(Export, Plot, OptimizeMeasurements, OptimizeTrajectory, LayersGIS):
         an array of point in the GEO coord system.        
     optimize_trajectory(self, lidar_ids, **kwargs)
         Finding a shortest trajectory through the set of measurement points.
-    generate_trajectory(lidar_pos, trajectory)
+    generate_trajectory(lidar_pos, trajectory, *, with_labels=True)
         Generates step-stare trajectory based on the lidar position and 
         trajectory points.
     plot_layer(layer_id, **kwargs)
@@ -183,6 +183,7 @@ class CPT(Export, Plot, OptimizeMeasurements, OptimizeTrajectory, LayersGIS):
     MAX_RANGE = 6000 # in m
     MAX_ACCELERATION = 100 # in deg / s^2
     MAX_VELOCITY = 50 # in deg / s
+    NO_TSP_STARTS = 8 # starting points tried in the trajectory optimization
     MAX_ELEVATION_ANGLE = 5 # in deg
     MAX_NO_OF_GATES = 100 # maximum number of range gates
     MIN_INTERSECTING_ANGLE = 30 # in deg
@@ -439,16 +440,10 @@ class CPT(Export, Plot, OptimizeMeasurements, OptimizeTrajectory, LayersGIS):
         This method is used during the generation of the beam steering coordinates.
         """        
 
-        if points_id == 'initial':
-            return np.asarray(self.measurements_dictionary['initial'].values[:, 1:].tolist())
-        elif points_id == 'optimized':
-            return np.asarray(self.measurements_dictionary['optimized'].values[:, 1:].tolist())
-        elif points_id == 'reachable':
-            return np.asarray(self.measurements_dictionary['reachable'].values[:, 1:].tolist())
-        elif points_id == 'identified':
-            return np.asarray(self.measurements_dictionary['identified'].values[:, 1:].tolist())
-        elif points_id == 'misc':
-            return np.asarray(self.measurements_dictionary['misc'].values[:, 1:].tolist())
+        if points_id in self.POINTS_ID:
+            points = self.measurements_dictionary[points_id]
+            return np.ascontiguousarray(
+                            points.iloc[:, 1:].to_numpy(dtype = np.float64))
         else:
             return None
 
@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from random import shuffle
+from numba import njit, prange
 
 def displacement2time(displacement, Amax, Vmax):
     """
@@ -39,22 +39,185 @@ def displacement2time(displacement, Amax, Vmax):
         Proceedings of ELEVCON’95, 1995.
     """
 
-    move_time = np.empty((len(displacement),), dtype=float)
+    inv_V = 1.0 / Vmax
+    inv_A = 1.0 / Amax
+    threshold = Vmax * Vmax * inv_A
+    tail = Vmax * inv_A
 
-    # find indexes for which the scanner head 
-    # will reach maximum velocity (i.e. rated speed)
-    index_a = np.where(displacement > (Vmax**2) / Amax)
+    move_time = np.empty(np.shape(displacement), dtype=float)
 
-    # find indexes for which the scanner head 
-    # will not reach maximum velocity (i.e. rated speed)
-    index_b = np.where(displacement <= (Vmax**2) / Amax)
+    # indicates for which displacements the scanner head 
+    # will reach maximum velocity (i.e. rated speed)
+    cond = displacement > threshold
+    not_cond = ~cond
 
-    move_time[index_a] = displacement[index_a] / Vmax + Vmax / Amax
-    move_time[index_b] = 2 * np.sqrt(displacement[index_b] / Amax)
+    # each branch is computed in place only where it applies
+    np.multiply(displacement, inv_V, out=move_time, where=cond)
+    np.add(move_time, tail, out=move_time, where=cond)
 
+    # negative displacements are clipped to keep the square root defined
+    np.maximum(displacement, 0.0, out=move_time, where=not_cond)
+    np.multiply(move_time, inv_A, out=move_time, where=not_cond)
+    np.sqrt(move_time, out=move_time, where=not_cond)
+    np.multiply(move_time, 2.0, out=move_time, where=not_cond)
 
     return move_time
 
+@njit('int64[:](float32[:, :], int64)', cache=True)
+def _nn_tour(cost_matrix, start):
+    """
+    Constructs a tour through all points using the Nearest Neighbor Heuristics.
+    
+    Parameters
+    ----------
+    cost_matrix : ndarray
+        N x N array containing cost of moving from i-th to j-th point.
+    start : int
+        Index of the tour starting point.
+    
+    Returns
+    -------
+    order : ndarray
+        1D array containing indexes of points in the order they are visited.
+
+    Notes
+    --------
+    The optimization of the trajectory is performed through the adaptation
+    of the Nearest Neighbor Heuristics solution for the traveling salesman
+    problem [1,2]. 
+
+    References
+    ----------
+    .. [1] Nikola Vasiljevic, Andrea Vignaroli, Andreas Bechmann and 
+        Rozenn Wagner: Digitalization of scanning lidar measurement
+        campaign planning, WES, 2019.
+    .. [2] Reinelt, G.: The Traveling Salesman: Computational Solutions 
+        for TSP Applications, Springer-Verlag, Berlin, Heidelberg, 1994.
+    """
+    no_points = cost_matrix.shape[0]
+    visited = np.zeros(no_points, np.bool_)
+    order = np.empty(no_points, np.int64)
+
+    order[0] = start
+    visited[start] = True
+
+    for i in range(1, no_points):
+        last_point = order[i - 1]
+        next_point = -1
+        min_cost = np.inf
+        # strict comparison keeps the first point among equally distant ones
+        for j in range(no_points):
+            if not visited[j] and cost_matrix[last_point, j] < min_cost:
+                min_cost = cost_matrix[last_point, j]
+                next_point = j
+        # costs are NaN for points coinciding with a lidar position, 
+        # in which case the first unvisited point is taken
+        if next_point == -1:
+            next_point = np.argmin(visited)
+        order[i] = next_point
+        visited[next_point] = True
+
+    return order
+
+@njit('int64[:](int64[:], float64[:, :])', cache=True)
+def _two_opt(order, cost_matrix):
+    """
+    Improves a closed tour through all points using the 2-opt heuristics.
+    
+    Parameters
+    ----------
+    order : ndarray
+        1D array containing indexes of points in the order they are visited.
+    cost_matrix : ndarray
+        Symmetric N x N array containing cost of moving 
+        from i-th to j-th point.
+    
+    Returns
+    -------
+    tour : ndarray
+        1D array containing indexes of points in the improved order.
+        The tour starts at the same point as the provided one.
+
+    Notes
+    --------
+    Two edges of the tour (a, b) and (c, d) are replaced with (a, c) and 
+    (b, d), reversing the part of the tour in between, as long as this 
+    reduces the total cost of the tour [1].
+
+    References
+    ----------
+    .. [1] Croes G. A.: A method for solving traveling-salesman problems,
+        Operations Research 6, 1958.
+    """
+    no_points = len(order)
+    tour = order.copy()
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(no_points - 2):
+            for j in range(i + 2, no_points):
+                # edges (i, i+1) and (j, j+1) are adjacent 
+                # when the tour is closed
+                if i == 0 and j == no_points - 1:
+                    continue
+                a = tour[i]
+                b = tour[i + 1]
+                c = tour[j]
+                d = tour[(j + 1) % no_points]
+                if (cost_matrix[a, c] + cost_matrix[b, d] < 
+                    cost_matrix[a, b] + cost_matrix[c, d]):
+                    tour[i + 1:j + 1] = tour[i + 1:j + 1][::-1].copy()
+                    improved = True
+
+    return tour
+
+@njit('int64[:](float32[:, :], float64[:, :], int64[:])', 
+      cache=True, parallel=True)
+def _best_tour(cost_matrix, move_time, starts):
+    """
+    Finds the fastest of the 2-opt improved Nearest Neighbor tours 
+    constructed from several starting points.
+    
+    Parameters
+    ----------
+    cost_matrix : ndarray
+        N x N array containing maximum angular displacements 
+        lidars need to perform between every pair of points.
+    move_time : ndarray
+        Symmetric N x N array containing synchronized move time in ms 
+        between every pair of points.
+    starts : ndarray
+        1D array containing indexes of the tours starting points.
+    
+    Returns
+    -------
+    tour : ndarray
+        1D array containing indexes of points in the order 
+        they are visited by the fastest tour.
+
+    Notes
+    -----
+    The tours are closed, i.e., they include the move from the last 
+    to the first point.
+    """
+    no_starts = len(starts)
+    no_points = cost_matrix.shape[0]
+    sync_time = np.empty(no_starts)
+    tours = np.empty((no_starts, no_points), np.int64)
+
+    # tours are independent so they are evaluated in parallel
+    for k in prange(no_starts):
+        tour = _two_opt(_nn_tour(cost_matrix, starts[k]), move_time)
+        tours[k] = tour
+        total_time = 0.0
+        for i in range(no_points):
+            total_time += move_time[tour[i - 1], tour[i]]
+        sync_time[k] = total_time
+
+    # argmin selects the first tour among equally fast ones
+    return tours[np.argmin(sync_time)]
+
 class OptimizeTrajectory():
     """
     A class containing methods for optimizing and generating lidar trajectories.
@@ -63,7 +226,7 @@ class OptimizeTrajectory():
     ------
     optimize_trajectory(self, lidar_ids, **kwargs)
         Finding a shortest trajectory through the set of measurement points.
-    generate_trajectory(lidar_pos, trajectory)
+    generate_trajectory(lidar_pos, trajectory, *, with_labels=True)
         Generates step-stare trajectory based on the lidar position and 
         trajectory points.
     """
@@ -85,14 +248,15 @@ class OptimizeTrajectory():
 
             print('Synchronizing trajectories for lidar instances:' 
                     + str(lidar_ids))                                                 
-            sync_time = []
             try:
-                for lidar in lidar_ids:
+                no_steps = len(
+                        self.lidar_dictionary[lidar_ids[0]]['motion_config'])
+                timings = np.empty((len(lidar_ids), no_steps))
+                for i, lidar in enumerate(lidar_ids):
                     motion_table = self.lidar_dictionary[lidar]['motion_config']
-                    timing = motion_table.loc[:, 'Move time [ms]'].values
-                    sync_time = sync_time + [timing]
+                    timings[i] = motion_table['Move time [ms]'].to_numpy()
 
-                sync_time = np.max(np.asarray(sync_time).T, axis = 1)
+                sync_time = timings.max(axis = 0)
 
                 
                 for lidar in lidar_ids:
@@ -144,203 +308,122 @@ class OptimizeTrajectory():
         value to their maximum negative value, or vice versa, in a change of 
         one increment. 
         """
-        angles_start = cls.generate_beam_coords(lidar_pos, 
-                                              np.roll(trajectory, 1, axis = 0), 
-                                              opt = 0)[:, (0,1)]
         angles_stop = cls.generate_beam_coords(lidar_pos, 
-                                              np.roll(trajectory, 0, axis = 0), 
+                                              trajectory, 
                                               opt = 0)[:, (0,1)]
-        angular_displacement = abs(angles_start - angles_stop)
-
-
-        ind_1 = np.where((angular_displacement[:, 0] > 180) & 
-                         (abs(360 - angular_displacement[:, 0]) <= 180))
-
-        ind_2 = np.where((angular_displacement[:, 0] > 180) & 
-                         (abs(360 - angular_displacement[:, 0]) > 180))
-        angular_displacement[:, 0][ind_1] = 360 - angular_displacement[:, 0][ind_1]
-        angular_displacement[:, 0][ind_2] = 360 + angular_displacement[:, 0][ind_2]
+        # each move starts where the previous one stopped
+        angles_start = np.roll(angles_stop, 1, axis = 0)
+        angular_displacement = cls.__rollover(angles_start, angles_stop)
 
-
-        ind_1 = np.where((angular_displacement[:, 1] > 180) & 
-                         (abs(360 - angular_displacement[:, 1]) <= 180))
-        ind_2 = np.where((angular_displacement[:, 1] > 180) & 
-                         (abs(360 - angular_displacement[:, 1]) > 180))
-        angular_displacement[:, 1][ind_1] = 360 - angular_displacement[:, 1][ind_1]
-        angular_displacement[:, 1][ind_2] = 360 + angular_displacement[:, 1][ind_2]
         return np.round(angles_start, cls.NO_DIGITS), \
                np.round(angles_stop, cls.NO_DIGITS), \
-               np.abs(angular_displacement)
+               angular_displacement
 
 
-    @classmethod
-    def __rollover(cls, point_1, point_2, lidar_position):
+    @staticmethod
+    def __rollover(angles_1, angles_2):
         """
-        Calculates a minimum angular move between two trajectory points.
+        Calculates a minimum angular move between two sets of angular positions.
         
         Parameters
         ----------
-        point_1 : ndarray
-            nD array containing the first trajectory point coordinates 
-            in the Cartesian coordinate system.
-        point_2 : ndarray
-            nD array containing the second trajectory point coordinates 
-            in the Cartesian coordinate system.
-        lidar_position : ndarray
-            nD array containing the lidar position in the Cartesian 
-            coordinate system.      
+        angles_1 : ndarray
+            nD array containing the first angular positions of the scanner head.
+        angles_2 : ndarray
+            nD array containing the second angular positions of the scanner head.
+        
         Returns
         -------
-        A minimum angular motion around the azimuth and elevation axes.
+        nD array containing absolute minimum angular motions, 
+        folded to the [0, 180] degrees interval.
 
         Notes
         --------
         This method considers the rollover to be feasible for the motion system.
         """
-
-        angles_1 = cls.generate_beam_coords(lidar_position, point_1, 1)[0]
-        angles_2 = cls.generate_beam_coords(lidar_position, point_2, 1)[0]
-
-        if abs(angles_1[0] - angles_2[0]) > 180:
-            if abs(360 - angles_1[0] + angles_2[0]) < 180:
-                azimuth_displacement = 360 - angles_1[0] + angles_2[0]
-            else:
-                azimuth_displacement = 360 + angles_1[0] - angles_2[0]
-        else:
-            azimuth_displacement =  angles_1[0] - angles_2[0]
-
-        if abs(angles_1[1] - angles_2[1]) > 180:
-            if abs(360 - angles_1[1] + angles_2[1]) < 180:
-                elevation_displacement = 360 - angles_1[1] + angles_2[1]
-            else:
-                elevation_displacement = 360 + angles_1[1] - angles_2[1]
-        else:
-            elevation_displacement =  angles_1[1] - angles_2[1]
-
-
-        return np.array([azimuth_displacement,elevation_displacement])
+        angular_displacement = np.subtract(angles_1, angles_2)
+        np.abs(angular_displacement, out=angular_displacement)
+        return np.minimum(angular_displacement, 
+                          np.subtract(360.0, angular_displacement),
+                          out=angular_displacement)
 
     @classmethod
-    def __calculate_max_move(cls, point_1, point_2, lidars):
+    def _pairwise_max_displacement(cls, points, lidars):
         """
-        Considering all provided lidar positions it calculates maximum
-        angular displacement they need to perform from one to another point.
+        Calculates maximum angular displacements lidars need to perform
+        between every pair of trajectory points.
         
         Parameters
         ----------
-        point_1 : ndarray
-            nD array containing the first trajectory point coordinates 
+        points : ndarray
+            nD array containing trajectory points coordinates 
             in the Cartesian coordinate system.
-        point_2 : ndarray
-            nD array containing the second trajectory point coordinates 
-            in the Cartesian coordinate system.
-        lidars : ndarray
-            nD array containing lidars positions in the Cartesian 
-            coordinate system.      
+        lidars : list of ndarray
+            A list of lidars positions in the Cartesian coordinate system.
 
         Returns
         -------
-        Maximum angular displacement lidars need to perform.
+        cost_matrix : ndarray
+            N x N array, where N is the number of points, containing 
+            maximum angular displacement around the azimuth and elevation 
+            axes that any of lidars needs to perform when moving from 
+            i-th to j-th point.
 
+        Notes
+        --------
+        This method considers the rollover to be feasible for the motion system.
         """
-        
-        azimuth_max = max(map(lambda x: abs(cls.__rollover(point_1, 
-                                                           point_2, 
-                                                           x)[0]), lidars))
-        elevation_max = max(map(lambda x: abs(cls.__rollover(point_1, 
-                                                             point_2, 
-                                                             x)[1]), lidars))
+        points = np.asarray(points, dtype = float)
+        no_points = len(points)
+
+        cost_matrix = np.zeros((no_points, no_points))
+        for lidar_pos in lidars:
+            # beam steering angles are calculated only once per point
+            angles = cls.generate_beam_coords(lidar_pos, 
+                                              points, 
+                                              opt = 0)[:, (0,1)]
+            # broadcasting gives displacements for all pairs of points
+            angular_displacement = cls.__rollover(angles[:, np.newaxis, :],
+                                                  angles[np.newaxis, :, :])
+            np.maximum(cost_matrix, 
+                       np.max(angular_displacement, axis = 2), 
+                       out = cost_matrix)
 
-        return max(azimuth_max,elevation_max)
+        return cost_matrix
 
-    def __tsp(self,  lidar_ids, points, start=None):
+    def _generate_timings(self, lidar_pos, trajectory):
         """
-        Solving a travelening salesman problem for a set of points and 
-        two lidar positions.
+        Calculates move times of the step-stare trajectory based on the 
+        lidar position and trajectory points.
         
         Parameters
         ----------
-        start : int
-            Presetting the trajectory starting point.
-            A default value is set to None.
-        lidar_ids : list of str
-            A list of strings containing lidar ids.
-        points : list
-            A list of coordinates of measurement points.
+        lidar_pos : ndarray
+            nD array containing the lidar position in a Cartesian 
+            coordinate system.
+        trajectory : ndarray
+            nD array containing trajectory points in a Cartesian 
+            coordinate system.
         
         Returns
         -------
-        trajectory : ndarray
-            An ordered nD array containing optimized trajectory points.
-        
-        See also
-        --------
-        self.generate_trajectory : generation of trajectories
+        angles_stop : ndarray
+            nD array containing the beam steering angles at trajectory points.
+        timing : ndarray
+            1D array containing move time in ms to each trajectory point.
+        """
 
-        Notes
-        --------
-        The optimization of the trajectory is performed through the adaptation
-        of the Nearest Neighbor Heuristics solution for the traveling salesman
-        problem [1,2]. 
+        _, angles_stop, angular_displacement =  self.trajectory2displacement(
+                                                                    lidar_pos, 
+                                                                    trajectory)
 
-        References
-        ----------
-        .. [1] Nikola Vasiljevic, Andrea Vignaroli, Andreas Bechmann and 
-            Rozenn Wagner: Digitalization of scanning lidar measurement
-            campaign planning, WES, 2019.
-        .. [2] Reinelt, G.: The Traveling Salesman: Computational Solutions 
-            for TSP Applications, Springer-Verlag, Berlin, Heidelberg, 1994.
+        move_time = displacement2time(np.max(angular_displacement, axis = 1),
+                                      self.MAX_ACCELERATION, 
+                                      self.MAX_VELOCITY)
 
-        Examples
-        --------
-        """
-        if (len(points) > 0 and len(lidar_ids) > 0):
-            if start is None:
-                shuffle(points)
-                start = points[0]
-            else:
-                start = points[start]
-
-            unvisited_points = points
-            # sets first trajectory point        
-            trajectory = [start]
-            # removes that point from the points list
-            unvisited_points.remove(start)
-
-            # lidar list
-            lidars = []
-            for lidar in lidar_ids:
-                lidars = lidars + [self.lidar_dictionary[lidar]['position']]
-            while unvisited_points:
-                last_point = trajectory[-1]
-                max_angular_displacements = []
-
-                # calculates maximum angular move from the last
-                # trajectory point to any other point which is not
-                # a part of the trajectory            
-                for next_point in unvisited_points:
-                    max_displacement = self.__calculate_max_move(
-                                                                last_point, 
-                                                                next_point, 
-                                                                lidars
-                                                                )
-                    max_angular_displacements = (max_angular_displacements 
-                                                    + [max_displacement])
-
-                # finds which displacement is shortest
-                # and the corresponding index in the list
-                min_displacement = min(max_angular_displacements)
-                index = max_angular_displacements.index(min_displacement)
-
-                # next trajectory point is added to the trajectory
-                # and removed from the list of unvisited points
-                next_trajectory_point = unvisited_points[index]
-                trajectory.append(next_trajectory_point)
-                unvisited_points.remove(next_trajectory_point)
-            trajectory = np.asarray(trajectory)
-            return trajectory
-
-    def generate_trajectory(self, lidar_pos, trajectory):
+        return angles_stop, np.ceil(move_time * 1000)
+
+    def generate_trajectory(self, lidar_pos, trajectory, *, with_labels = True):
         """
         Generates step-stare trajectory based on the lidar position and 
         trajectory points.
@@ -353,24 +436,22 @@ class OptimizeTrajectory():
         trajectory : ndarray
             nD array containing trajectory points in a Cartesian 
             coordinate system.
+        with_labels : bool, optional
+            Indicates whether to add the 'Step-stare order' column
+            to the motion table.
+            The default value is set to True.
         
         Returns
         -------
         motion_table : pd dataframe
             Pandas dataframe containing beam steering angles and motion time.
-        """
-
-        _, angles_stop, angular_displacement =  self.trajectory2displacement(
-                                                                    lidar_pos, 
-                                                                    trajectory)
-
-
-        move_time = displacement2time(np.max(angular_displacement, axis = 1),
-                                      self.MAX_ACCELERATION, 
-                                      self.MAX_VELOCITY)
 
+        See also
+        --------
+        self._generate_timings : move times without the motion table
+        """
 
-        timing = np.ceil(move_time * 1000)
+        angles_stop, timing = self._generate_timings(lidar_pos, trajectory)
 
         matrix = np.array([angles_stop[:,0],
                            angles_stop[:,1],
@@ -379,23 +460,16 @@ class OptimizeTrajectory():
         motion_table = pd.DataFrame(matrix, columns = ["Azimuth [deg]", 
                                                        "Elevation [deg]", 
                                                        "Move time [ms]"])
-        first_column = []
-
-        for i in range(0, len(angular_displacement)):
-            if i == 0:
-                insert_str = str(len(angular_displacement)) + '->' + str(i + 1)
-                first_column = first_column + [insert_str]
-            else:
-                insert_str = str(i) + '->' + str(i+1) 
-                first_column = first_column + [insert_str]
+        if not with_labels:
+            return motion_table
 
-            # # old way
-            # if i != len(angular_displacement) - 1:
-            #     insert_str = str(i + 1) + '->' + str(i + 2)
-            #     first_column = first_column + [insert_str]
-            # else:
-            #     insert_str = str(i + 1) + '->1' 
-            #     first_column = first_column + [insert_str]
+        # step i is the move from (i-1)-th to i-th point, 
+        # while the first step closes the trajectory
+        no_steps = len(timing)
+        first_column = np.char.add(
+                            np.char.add(np.arange(no_steps).astype(str), '->'),
+                            np.arange(1, no_steps + 1).astype(str))
+        first_column[0] = str(no_steps) + '->1'
 
         motion_table.insert(loc=0, column='Step-stare order', value=first_column)
         return motion_table
@@ -429,14 +503,21 @@ class OptimizeTrajectory():
         Notes
         --------
         The optimization of the trajectory is performed by applying the adapted 
-        traveling salesman problem to the measurement point set while varing the
-        starting point of the trajecRtory. This secures the shortest trajectory. 
+        traveling salesman problem to the measurement point set [1]. 
+        Trajectories are constructed using the Nearest Neighbor Heuristics 
+        from NO_TSP_STARTS evenly spread starting points and afterwards 
+        improved using the 2-opt heuristics [2]. The fastest of them is kept.
+        This does not secure that the trajectory is faster than the best 
+        Nearest Neighbor trajectory over all starting points, although it 
+        typically is, and the computation is an order of N cheaper.
 
         References
         ----------
         .. [1] Nikola Vasiljevic, Andrea Vignaroli, Andreas Bechmann and 
             Rozenn Wagner: Digitalization of scanning lidar measurement
             campaign planning, WES, 2019.
+        .. [2] Croes G. A.: A method for solving traveling-salesman problems,
+            Operations Research 6, 1958.
 
         """        
         # selecting points which will be used for optimization
@@ -458,46 +539,31 @@ class OptimizeTrajectory():
 
             if len(measurement_pts) > 0:
                 self.points_id = points_id
-                sync_time_list = []
-                for i in range(0,len(measurement_pts)):
-                    trajectory = self.__tsp(lidar_ids,
-                                            measurement_pts.tolist(), 
-                                            i)
-                    # needs to record each lidar timing for each move
-                    # and then if we want to keep them in syn
-                    sync_time = []
-                    for lidar in lidar_ids:
-
-                        motion_table = self.generate_trajectory(
-                                self.lidar_dictionary[lidar]['position'], 
-                                trajectory)
-
-                        timing = motion_table.loc[:, 'Move time [ms]'].values
-                        sync_time = sync_time + [timing]
-                    sync_time = np.sum(
-                                    np.max(
-                                        np.asarray(sync_time).T, 
-                                        axis = 1)
-                                        )
-                    sync_time_list = sync_time_list + [sync_time]
-                    
-                        # if i == 0:
-                        #     total_time.update({lidar:{i : timing}})
-                        # else:
-                        #     total_time[lidar].update({i : timing})
-
-                sync_time_list = np.asarray(sync_time_list)
-                self.temp = sync_time_list
-                # this returns tuple, and sometimes by chance there 
-                # are two min values we are selecting first one!
-                # first 0 means to select the array from the tuple, 
-                # while second 0 results in selecting the first min value
-                min_traj_ind = np.where(
-                        sync_time_list == np.min(sync_time_list))[0][0]
-                        
-                trajectory = self.__tsp(lidar_ids,
-                                        measurement_pts.tolist(),
-                                        min_traj_ind)
+                lidars = [self.lidar_dictionary[lidar]['position'] 
+                          for lidar in lidar_ids]
+                cost_matrix = self._pairwise_max_displacement(measurement_pts,
+                                                              lidars)
+
+                # the trajectory cost is the total move time in ms when 
+                # the lidars are kept in sync, i.e. the slowest lidar 
+                # sets the move time of each step
+                move_time = np.ceil(displacement2time(cost_matrix, 
+                                                      self.MAX_ACCELERATION,
+                                                      self.MAX_VELOCITY) 
+                                    * 1000)
+
+                # single precision is ample for comparing displacements in 
+                # degrees, but the move times above are calculated in double
+                # precision to match the generated motion tables
+                cost_matrix = cost_matrix.astype(np.float32)
+
+                # a few evenly spread starting points guard against 
+                # a poor nearest neighbor tour at a small cost
+                no_starts = min(len(measurement_pts), self.NO_TSP_STARTS)
+                starts = np.linspace(0, len(measurement_pts) - 1, 
+                                     no_starts).astype(np.int64)
+                order = _best_tour(cost_matrix, move_time, starts)
+                trajectory = measurement_pts[order]
 
                 trajectory = pd.DataFrame(trajectory, columns = [
                                                         "Easting [m]", 
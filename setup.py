@@ -34,6 +34,7 @@ setup(
     python_requires='>=3.7',
     install_requires=[
                       'numpy', 
+                      'numba', 
                       'pandas', 
                       'geopandas', 
                       'whitebox', 